@@ -15,19 +15,36 @@ are never committed into version control. See the README for details on
 setting these variables before running the server.
 """
 
+import atexit
+import hashlib
+import io
 import os
-import boto3
-from flask import Flask, request, jsonify
+import threading
+import time
+import uuid
+from typing import Annotated, Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote
 
-app = Flask(__name__)
-s3 = boto3.client(
-    's3',
-    aws_access_key_id=os.environ['AWS_ACCESS_KEY_ID'],
-    aws_secret_access_key=os.environ['AWS_SECRET_ACCESS_KEY'],
-    region_name='sa-east-1'
+from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from pydantic import (
+    BaseModel,
+    Field,
+    StrictInt,
+    StringConstraints,
+    ValidationError,
+    model_validator,
+)
+from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.utils import secure_filename
 
 try:
     import boto3  # AWS SDK for Python
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
 except ImportError:
     boto3 = None  # type: ignore
 
@@ -36,12 +53,157 @@ try:
 except ImportError:
     stripe = None  # type: ignore
 
+try:
+    from PIL import Image, ImageOps  # Optional thumbnail generation
+except ImportError:
+    Image = None  # type: ignore
+
+try:
+    import orjson  # Faster JSON encoding/decoding
+except ImportError:
+    orjson = None  # type: ignore
+
 import requests  # For Notion API calls
+from requests.adapters import HTTPAdapter
+
+# Lifetime (seconds) of presigned gallery URLs
+PRESIGNED_URL_EXPIRY = 3600
+
+# Cache key prefix and lifetime (seconds) for gallery listing pages. Cached
+# entries are the serialized JSON body and its ETag, with the presigned URLs
+# already included, so a hit skips the S3 list call, the per-object signing and
+# JSON encoding. Every page key embeds the current generation, which an upload
+# replaces to invalidate all cached pages at once.
+GALLERY_CACHE_KEY = "gallery_page"
+GALLERY_GENERATION_KEY = "gallery_page:generation"
+GALLERY_CACHE_TIMEOUT = 60
+
+# Lifetime (seconds) of presigned gallery pages when the cache is shared
+# through Redis. Re-signing changes the body, so a short lifetime would change
+# the ETag on every refresh and defeat If-None-Match; these pages are kept for
+# most of the URL lifetime instead (still leaving clients ten minutes of
+# validity). Only a shared cache sees every upload's generation bump, so the
+# per-process cache and CDN pages keep GALLERY_CACHE_TIMEOUT. Objects added or
+# removed outside the upload endpoint can take up to this long to show up.
+SIGNED_GALLERY_CACHE_TIMEOUT = PRESIGNED_URL_EXPIRY - 600
+
+# Default and maximum number of objects returned per gallery page
+GALLERY_PAGE_LIMIT = 100
+GALLERY_MAX_PAGE_LIMIT = 1000
+
+# Per-client quotas for endpoints that incur provider cost (Stripe, SNS)
+PAYMENTS_RATE_LIMIT = "10/minute"
+NOTIFICATIONS_RATE_LIMIT = "10/minute"
+
+# Multipart settings for image uploads: files above 8 MiB are sent as 8 MiB
+# parts uploaded in parallel
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+UPLOAD_MAX_CONCURRENCY = 8
+
+# Gallery originals live under GALLERY_PREFIX, which is the only prefix the
+# listing walks. Uploaded images also get a small JPEG thumbnail for the mobile
+# gallery grid, stored under THUMBNAIL_PREFIX followed by the original's key.
+GALLERY_PREFIX = "gallery/"
+THUMBNAIL_PREFIX = "thumb/"
+THUMBNAIL_SIZE = (400, 400)
+
+# Upper bound (seconds) on a single Notion call so a slow upstream cannot hold
+# a worker thread indefinitely.
+NOTION_TIMEOUT = 10
+
+# Parsed calendar events are cached for a couple of minutes to stay well under
+# Notion's rate limit. A second copy without expiry is kept as a fallback for
+# when Notion errors out or is unreachable.
+CALENDAR_CACHE_KEY = "notion:calendar:response"
+CALENDAR_LAST_GOOD_KEY = "notion:calendar:last_good_response"
+CALENDAR_CACHE_TIMEOUT = 120
+
+# How long clients may reuse a gallery/calendar response before revalidating
+# it with If-None-Match
+CLIENT_MAX_AGE = 30
+
+# Seconds between background refreshes of the gallery and calendar caches.
+# The refresh is off unless CACHE_WARM_INTERVAL is set to a positive value.
+# Warmed entries outlive the interval by CACHE_WARM_MARGIN so they are still
+# cached when the next refresh (which starts after the previous one) runs.
+CACHE_WARM_INTERVAL = 0
+CACHE_WARM_MARGIN = 30
+CACHE_WARM_LOCK_KEY = "cache_warm:lock"
+GALLERY_WARM_LOCK_KEY = "cache_warm:gallery_lock"
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for large gallery/calendar payloads.
+
+    orjson encodes datetime, UUID and dataclass values natively instead of
+    calling `default`, so dates come out as ISO 8601 strings rather than
+    Flask's HTTP-date format.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+class PaymentRequest(BaseModel):
+    """JSON body accepted by POST /api/payments."""
+
+    # Strict, so JSON true or "12" is not coerced into a charge amount
+    amount: StrictInt = Field(gt=0)
+    currency: str = Field(default="usd", pattern=r"^[a-z]{3}$")
+    metadata: Dict[str, str] = Field(default_factory=dict)
+
+
+class NotificationRequest(BaseModel):
+    """JSON body accepted by POST /api/notifications."""
+
+    subject: str = "Notification"
+    message: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+    topic_arn: Optional[str] = None
+    phone_number: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_single_target(self) -> "NotificationRequest":
+        if bool(self.topic_arn) == bool(self.phone_number):
+            raise ValueError("Exactly one of topic_arn or phone_number must be provided")
+        return self
+
+
+def validation_error(exc: ValidationError) -> Any:
+    """Return a 400 response describing why a request body was rejected."""
+    details = exc.errors(include_url=False, include_context=False, include_input=False)
+    return jsonify({"error": "Invalid request", "details": details}), 400
+
+
+class NotionAPIError(Exception):
+    """Raised when the Notion API answers with a non-200 status."""
+
+
+def make_thumbnail(stream: Any) -> io.BytesIO:
+    """Render a JPEG thumbnail of the image in `stream` that fits THUMBNAIL_SIZE."""
+    with Image.open(stream) as image:
+        # Apply the EXIF orientation so phone photos are not rotated, since
+        # the saved JPEG carries no EXIF data
+        upright = ImageOps.exif_transpose(image)
+        upright.thumbnail(THUMBNAIL_SIZE)
+        buffer = io.BytesIO()
+        upright.convert("RGB").save(buffer, format="JPEG", quality=80, optimize=True)
+    buffer.seek(0)
+    return buffer
 
 
 def create_app() -> Flask:
     """Factory to create and configure the Flask application."""
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
 
     # Basic configuration via environment variables
     s3_bucket = os.environ.get("S3_BUCKET_NAME")
@@ -49,20 +211,259 @@ def create_app() -> Flask:
     notion_database_id = os.environ.get("NOTION_DATABASE_ID")
     aws_region = os.environ.get("AWS_REGION", "us-east-1")
     stripe_secret_key = os.environ.get("STRIPE_SECRET_KEY")
+    redis_url = os.environ.get("REDIS_URL")
+    cdn_base_url = os.environ.get("CDN_BASE_URL", "").rstrip("/")
+    cache_warm_interval = int(os.environ.get("CACHE_WARM_INTERVAL", CACHE_WARM_INTERVAL))
+    trusted_proxies = int(os.environ.get("TRUSTED_PROXY_COUNT", 0))
+
+    # Behind a reverse proxy or load balancer, take the client address (and
+    # scheme) from the X-Forwarded-* headers set by that many trusted hops, so
+    # the rate limiter sees real clients instead of the proxy
+    if trusted_proxies > 0:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=trusted_proxies, x_proto=trusted_proxies)
+
+    # Response cache: Redis when configured, otherwise a per-process cache
+    if redis_url:
+        cache_config = {"CACHE_TYPE": "RedisCache", "CACHE_REDIS_URL": redis_url}
+    else:
+        cache_config = {"CACHE_TYPE": "SimpleCache"}
+    cache = Cache(app, config=cache_config)
+
+    # Rate limiter sharing the same Redis, so quotas hold across workers
+    limiter = Limiter(
+        get_remote_address,
+        app=app,
+        storage_uri=redis_url or "memory://",
+        headers_enabled=True,
+    )
 
-    # Initialize AWS clients lazily
+    @app.errorhandler(429)
+    def rate_limited(exc: Any) -> Any:
+        return jsonify({"error": f"Rate limit exceeded: {exc.description}"}), 429
+
+    # Initialize AWS clients lazily. boto3 clients are thread-safe, so a single
+    # instance of each is shared by all worker threads; a blocking S3/SNS call
+    # only occupies the thread serving that request.
     s3_client = None
     sns_client = None
+    transfer_config = None
     if boto3 is not None:
+        # Size the connection pool above the worker thread count and let
+        # botocore back off adaptively when AWS throttles
+        boto_config = BotoConfig(
+            max_pool_connections=64,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+        )
         if s3_bucket:
-            s3_client = boto3.client("s3", region_name=aws_region)
+            s3_client = boto3.client("s3", region_name=aws_region, config=boto_config)
+        transfer_config = TransferConfig(
+            multipart_threshold=UPLOAD_PART_SIZE,
+            multipart_chunksize=UPLOAD_PART_SIZE,
+            max_concurrency=UPLOAD_MAX_CONCURRENCY,
+            use_threads=True,
+        )
         # Create SNS client for notifications (optional)
-        sns_client = boto3.client("sns", region_name=aws_region)
+        sns_client = boto3.client("sns", region_name=aws_region, config=boto_config)
+
+    # Shared HTTP session for Notion so TCP/TLS connections are kept alive and
+    # reused across requests instead of being re-established on every call.
+    # The pool is sized for the worker threads and carries the static headers.
+    notion_session = requests.Session()
+    notion_session.headers.update(
+        {
+            "Authorization": f"Bearer {notion_token}",
+            "Notion-Version": "2022-06-28",
+            "Content-Type": "application/json",
+        }
+    )
+    notion_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    atexit.register(notion_session.close)
 
     # Initialize Stripe if available
     if stripe is not None and stripe_secret_key:
         stripe.api_key = stripe_secret_key
 
+    def cache_get(key: str) -> Any:
+        """Read from the cache, treating a cache backend failure as a miss."""
+        try:
+            return cache.get(key)
+        except Exception as exc:
+            app.logger.warning("Cache read failed for %s: %s", key, exc)
+            return None
+
+    def cache_set(key: str, value: Any, timeout: int) -> None:
+        """Write to the cache, logging instead of failing the request on errors."""
+        try:
+            cache.set(key, value, timeout=timeout)
+        except Exception as exc:
+            app.logger.warning("Cache write failed for %s: %s", key, exc)
+
+    def gallery_cache_key(limit: int, page_token: Optional[str], signed: bool) -> str:
+        """Build the cache key for one page of the gallery listing."""
+        generation = cache_get(GALLERY_GENERATION_KEY) or ""
+        url_kind = "signed" if signed else "cdn"
+        return f"{GALLERY_CACHE_KEY}:{generation}:{url_kind}:{limit}:{page_token or ''}"
+
+    def gallery_cache_timeout(signed: bool) -> int:
+        """Return how long a gallery page may stay cached."""
+        if signed and redis_url:
+            return SIGNED_GALLERY_CACHE_TIMEOUT
+        return GALLERY_CACHE_TIMEOUT
+
+    def object_url(key: str, signed: bool) -> str:
+        """Return a download URL for an object: presigned S3 or via the CDN."""
+        if not signed:
+            return f"{cdn_base_url}/{quote(key)}"
+        return s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": s3_bucket, "Key": key},
+            ExpiresIn=PRESIGNED_URL_EXPIRY,
+        )
+
+    def encode_payload(payload: Any) -> Tuple[str, str]:
+        """Serialize a payload once and return its (etag, body) pair for caching."""
+        body = app.json.dumps(payload)
+        etag = hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+        return etag, body
+
+    def conditional_json(entry: Tuple[str, str]) -> Any:
+        """Build a JSON response that answers a matching If-None-Match with 304."""
+        etag, body = entry
+        response = app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+        response.cache_control.private = True
+        response.cache_control.max_age = CLIENT_MAX_AGE
+        return response.make_conditional(request)
+
+    def existing_thumbnails(first_key: str, last_key: str) -> Set[str]:
+        """Return the original keys in [first_key, last_key] that have a thumbnail.
+
+        Thumbnail keys sort in the same order as their originals, so a single
+        range listing under THUMBNAIL_PREFIX covers a whole gallery page.
+        """
+        found: Set[str] = set()
+        paginator = s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=s3_bucket,
+            Prefix=f"{THUMBNAIL_PREFIX}{GALLERY_PREFIX}",
+            # Dropping the last character sorts just before the first thumbnail
+            StartAfter=f"{THUMBNAIL_PREFIX}{first_key}"[:-1],
+        )
+        for resp in pages:
+            for obj in resp.get("Contents", []):
+                key = obj["Key"][len(THUMBNAIL_PREFIX):]
+                if key > last_key:
+                    return found
+                found.add(key)
+        return found
+
+    def refresh_gallery_page(
+        limit: int,
+        page_token: Optional[str],
+        signed: bool,
+        timeout: Optional[int] = None,
+    ) -> Tuple[str, str]:
+        """List one page of objects in the bucket and store it in the cache."""
+        # Take the key (and so the generation) before listing, so an upload that
+        # lands mid-listing is not hidden behind a page stored under its generation
+        cache_key = gallery_cache_key(limit, page_token, signed)
+        paginator = s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=s3_bucket,
+            Prefix=GALLERY_PREFIX,
+            PaginationConfig={
+                "MaxItems": limit,
+                "PageSize": limit,
+                "StartingToken": page_token,
+            },
+        )
+        keys = [obj["Key"] for resp in pages for obj in resp.get("Contents", [])]
+        thumbnails = existing_thumbnails(keys[0], keys[-1]) if keys else set()
+        objects: List[Dict[str, Any]] = []
+        for key in keys:
+            item = {"key": key, "url": object_url(key, signed)}
+            if key in thumbnails:
+                item["thumb"] = object_url(f"{THUMBNAIL_PREFIX}{key}", signed)
+            objects.append(item)
+        entry = encode_payload({"items": objects, "next_token": pages.resume_token})
+        if timeout is None:
+            timeout = gallery_cache_timeout(signed)
+        cache_set(cache_key, entry, timeout)
+        return entry
+
+    def refresh_calendar(timeout: int = CALENDAR_CACHE_TIMEOUT) -> Tuple[str, str]:
+        """Query Notion for calendar events and store them in the cache."""
+        notion_api_url = f"https://api.notion.com/v1/databases/{notion_database_id}/query"
+        resp = notion_session.post(notion_api_url, json={}, timeout=NOTION_TIMEOUT)
+        if resp.status_code != 200:
+            raise NotionAPIError(resp.text)
+        data: Dict[str, Any] = app.json.loads(resp.content)
+        events: List[Dict[str, Any]] = []
+        for page in data.get("results", []):
+            # Basic parsing: extract date and title from properties
+            properties = page.get("properties", {})
+            title_props = properties.get("Name", {})
+            title_items = title_props.get("title", [])
+            title = "".join(item.get("plain_text", "") for item in title_items)
+            date_props = properties.get("Date", {}).get("date", {})
+            start = date_props.get("start")
+            end = date_props.get("end")
+            events.append({"title": title, "start": start, "end": end})
+        entry = encode_payload(events)
+        cache_set(CALENDAR_CACHE_KEY, entry, timeout)
+        cache_set(CALENDAR_LAST_GOOD_KEY, entry, 0)
+        return entry
+
+    def warm_caches() -> None:
+        """Warm the S3 connection, then periodically refresh the first gallery
+        page and the calendar.
+
+        The lock key lets a single worker process do the refresh for each
+        interval when the cache is shared through Redis.
+        """
+        warm_timeout = cache_warm_interval + CACHE_WARM_MARGIN
+        # Re-sign the gallery page only shortly before it expires, so its ETag
+        # stays stable for clients in between
+        gallery_signed = not cdn_base_url
+        gallery_timeout = gallery_cache_timeout(gallery_signed)
+        gallery_refresh_period = max(gallery_timeout - warm_timeout, cache_warm_interval)
+        if s3_client and s3_bucket:
+            # Resolve credentials and open a keep-alive connection in this
+            # process, off the startup path, so its first gallery request does
+            # not pay for them
+            try:
+                s3_client.head_bucket(Bucket=s3_bucket)
+            except Exception as exc:
+                app.logger.warning("S3 warm-up failed: %s", exc)
+        while True:
+            # Cache errors (e.g. Redis going away) must not end the thread
+            try:
+                if cache.add(CACHE_WARM_LOCK_KEY, 1, timeout=max(cache_warm_interval - 1, 1)):
+                    if s3_client and s3_bucket:
+                        gallery_key = gallery_cache_key(GALLERY_PAGE_LIMIT, None, gallery_signed)
+                        due = cache.add(GALLERY_WARM_LOCK_KEY, 1, timeout=gallery_refresh_period)
+                        if due or cache.get(gallery_key) is None:
+                            try:
+                                refresh_gallery_page(
+                                    GALLERY_PAGE_LIMIT,
+                                    None,
+                                    gallery_signed,
+                                    timeout=max(gallery_timeout, warm_timeout),
+                                )
+                            except Exception as exc:
+                                app.logger.warning("Gallery cache refresh failed: %s", exc)
+                    if notion_token and notion_database_id:
+                        try:
+                            refresh_calendar(timeout=max(CALENDAR_CACHE_TIMEOUT, warm_timeout))
+                        except Exception as exc:
+                            app.logger.warning("Calendar cache refresh failed: %s", exc)
+            except Exception as exc:
+                app.logger.warning("Cache warm-up failed: %s", exc)
+            time.sleep(cache_warm_interval)
+
+    if cache_warm_interval > 0:
+        threading.Thread(target=warm_caches, name="cache-warmer", daemon=True).start()
+
     # Health check endpoint
     @app.route("/api/health", methods=["GET"])
     def health_check() -> Any:
@@ -73,7 +474,14 @@ def create_app() -> Flask:
     @app.route("/api/gallery", methods=["GET", "POST"])
     def gallery() -> Any:
         """
-        GET: Return a list of objects (images) in the configured S3 bucket.
+        GET: Return one page of objects (images) in the configured S3 bucket
+        as {"items": [...], "next_token": ...}; each item carries the full-size
+        `url`, plus a `thumb` URL when a thumbnail exists. Accepts optional `limit` and
+        `page_token` query parameters; pass `next_token` back as `page_token`
+        to fetch the following page. `next_token` is null on the last page.
+        When CDN_BASE_URL is set, item URLs point at the CDN; pass `signed=1`
+        to get presigned S3 URLs instead (e.g. for private objects).
+        Responses carry an ETag; a matching If-None-Match gets a 304.
         POST: Upload a new image to the bucket. Expects a multipart/form-data
         request with a file under the key "image".
         """
@@ -81,20 +489,17 @@ def create_app() -> Flask:
             return jsonify({"error": "S3 is not configured"}), 500
 
         if request.method == "GET":
-            # List objects in the bucket
-            objects: List[Dict[str, Any]] = []
+            limit = request.args.get("limit", GALLERY_PAGE_LIMIT, type=int)
+            limit = max(1, min(limit, GALLERY_MAX_PAGE_LIMIT))
+            page_token = request.args.get("page_token") or None
+            signed = not cdn_base_url or request.args.get("signed") == "1"
+
+            cached = cache_get(gallery_cache_key(limit, page_token, signed))
+            if cached is not None:
+                return conditional_json(cached)
+
             try:
-                resp = s3_client.list_objects_v2(Bucket=s3_bucket)
-                for obj in resp.get("Contents", []):
-                    key = obj.get("Key")
-                    # Generate a presigned URL for each object so the client can download it
-                    url = s3_client.generate_presigned_url(
-                        "get_object",
-                        Params={"Bucket": s3_bucket, "Key": key},
-                        ExpiresIn=3600,
-                    )
-                    objects.append({"key": key, "url": url})
-                return jsonify(objects)
+                return conditional_json(refresh_gallery_page(limit, page_token, signed))
             except Exception as exc:
                 return jsonify({"error": str(exc)}), 500
 
@@ -102,14 +507,44 @@ def create_app() -> Flask:
         file = request.files.get("image")
         if not file:
             return jsonify({"error": "No file provided"}), 400
+        # A random prefix keeps same-named uploads from overwriting each other
+        # and spreads keys across the bucket's key space
+        filename = secure_filename(file.filename or "") or "image"
+        key = f"{GALLERY_PREFIX}{uuid.uuid4().hex[:8]}/{filename}"
+        thumbnail = None
+        if Image is not None:
+            try:
+                thumbnail = make_thumbnail(file.stream)
+            except Exception as exc:
+                app.logger.warning("Thumbnail generation failed for %s: %s", key, exc)
+            file.stream.seek(0)
         try:
-            s3_client.upload_fileobj(file, s3_bucket, file.filename)
-            return jsonify({"message": "File uploaded", "filename": file.filename})
+            s3_client.upload_fileobj(
+                file.stream,
+                s3_bucket,
+                key,
+                Config=transfer_config,
+                ExtraArgs={"ContentType": file.mimetype or "application/octet-stream"},
+            )
         except Exception as exc:
             return jsonify({"error": str(exc)}), 500
+        if thumbnail is not None:
+            try:
+                s3_client.upload_fileobj(
+                    thumbnail,
+                    s3_bucket,
+                    f"{THUMBNAIL_PREFIX}{key}",
+                    ExtraArgs={"ContentType": "image/jpeg"},
+                )
+            except Exception as exc:
+                app.logger.warning("Thumbnail upload failed for %s: %s", key, exc)
+        # Every cached page is stale now; start a new generation
+        cache_set(GALLERY_GENERATION_KEY, uuid.uuid4().hex, 0)
+        return jsonify({"message": "File uploaded", "filename": file.filename, "key": key})
 
     # Payments endpoint
     @app.route("/api/payments", methods=["POST"])
+    @limiter.limit(PAYMENTS_RATE_LIMIT)
     def create_payment() -> Any:
         """
         Create a payment intent for a session. This uses Stripe by default.
@@ -119,17 +554,16 @@ def create_app() -> Flask:
         if stripe is None or stripe_secret_key is None:
             return jsonify({"error": "Payments are not configured"}), 500
 
-        data = request.get_json(force=True)
-        amount = data.get("amount")
-        currency = data.get("currency", "usd")
-        if not amount:
-            return jsonify({"error": "Amount is required"}), 400
+        try:
+            payment = PaymentRequest.model_validate_json(request.get_data())
+        except ValidationError as exc:
+            return validation_error(exc)
         try:
             # Create a PaymentIntent with Stripe
             intent = stripe.PaymentIntent.create(
-                amount=int(amount),
-                currency=currency,
-                metadata=data.get("metadata", {}),
+                amount=payment.amount,
+                currency=payment.currency,
+                metadata=payment.metadata,
             )
             return jsonify({"client_secret": intent.client_secret})
         except Exception as exc:
@@ -137,36 +571,33 @@ def create_app() -> Flask:
 
     # Notifications endpoint
     @app.route("/api/notifications", methods=["POST"])
+    @limiter.limit(NOTIFICATIONS_RATE_LIMIT)
     def send_notification() -> Any:
         """
         Send a notification to a client using AWS SNS. Expects JSON with
-        `subject`, `message`, and optionally `topic_arn` or `phone_number`.
+        `message`, optionally `subject`, and exactly one of `topic_arn` or
+        `phone_number`.
         """
         if sns_client is None:
             return jsonify({"error": "SNS is not configured"}), 500
 
-        data = request.get_json(force=True)
-        subject = data.get("subject", "Notification")
-        message = data.get("message")
-        topic_arn = data.get("topic_arn")
-        phone_number = data.get("phone_number")
-        if not message:
-            return jsonify({"error": "Message is required"}), 400
+        try:
+            notification = NotificationRequest.model_validate_json(request.get_data())
+        except ValidationError as exc:
+            return validation_error(exc)
 
         try:
-            if topic_arn:
+            if notification.topic_arn:
                 response = sns_client.publish(
-                    TopicArn=topic_arn,
-                    Message=message,
-                    Subject=subject,
+                    TopicArn=notification.topic_arn,
+                    Message=notification.message,
+                    Subject=notification.subject,
                 )
-            elif phone_number:
+            else:
                 response = sns_client.publish(
-                    PhoneNumber=phone_number,
-                    Message=message,
+                    PhoneNumber=notification.phone_number,
+                    Message=notification.message,
                 )
-            else:
-                return jsonify({"error": "topic_arn or phone_number must be provided"}), 400
             return jsonify({"message_id": response.get("MessageId")})
         except Exception as exc:
             return jsonify({"error": str(exc)}), 500
@@ -176,35 +607,24 @@ def create_app() -> Flask:
     def get_calendar_events() -> Any:
         """
         Fetch upcoming events from a Notion database. Requires NOTION_TOKEN
-        and NOTION_DATABASE_ID environment variables. Returns a list of events.
+        and NOTION_DATABASE_ID environment variables. Returns a list of events
+        with an ETag; a matching If-None-Match gets a 304.
         """
         if not notion_token or not notion_database_id:
             return jsonify({"error": "Notion is not configured"}), 500
 
-        notion_api_url = f"https://api.notion.com/v1/databases/{notion_database_id}/query"
-        headers = {
-            "Authorization": f"Bearer {notion_token}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json",
-        }
+        cached = cache_get(CALENDAR_CACHE_KEY)
+        if cached is not None:
+            return conditional_json(cached)
+
         try:
-            resp = requests.post(notion_api_url, headers=headers, json={})
-            if resp.status_code != 200:
-                return jsonify({"error": "Notion API returned an error", "details": resp.text}), 500
-            data: Dict[str, Any] = resp.json()
-            events: List[Dict[str, Any]] = []
-            for page in data.get("results", []):
-                # Basic parsing: extract date and title from properties
-                properties = page.get("properties", {})
-                title_props = properties.get("Name", {})
-                title_items = title_props.get("title", [])
-                title = "".join(item.get("plain_text", "") for item in title_items)
-                date_props = properties.get("Date", {}).get("date", {})
-                start = date_props.get("start")
-                end = date_props.get("end")
-                events.append({"title": title, "start": start, "end": end})
-            return jsonify(events)
+            return conditional_json(refresh_calendar())
         except Exception as exc:
+            stale = cache_get(CALENDAR_LAST_GOOD_KEY)
+            if stale is not None:
+                return conditional_json(stale)
+            if isinstance(exc, NotionAPIError):
+                return jsonify({"error": "Notion API returned an error", "details": str(exc)}), 500
             return jsonify({"error": str(exc)}), 500
 
     return app
@@ -213,4 +633,4 @@ def create_app() -> Flask:
 if __name__ == "__main__":
     # When run directly, create the app and serve it
     application = create_app()
-    application.run(host="0.0.0.0", port=int(os.environ.get("PORT", 5000)))
+    application.run(host="0.0.0.0", port=int(os.environ.get("PORT", 5000)), threaded=True)
@@ -0,0 +1,82 @@
+"""
+Move gallery images uploaded before the `gallery/` prefix into the current
+layout.
+
+The gallery endpoint only lists originals stored under GALLERY_PREFIX and
+looks up their thumbnails under THUMBNAIL_PREFIX + key. Older deployments
+stored originals at the bucket root (or under a random `xxxxxxxx/` prefix)
+and thumbnails at `thumb/<key>`. This script copies each such object to its
+new key and then deletes the old one:
+
+* `<key>`        -> `gallery/<key>`
+* `thumb/<key>`  -> `thumb/gallery/<key>`
+
+It is safe to re-run: objects already in the new layout are left alone.
+Uses the same environment variables as the backend (S3_BUCKET_NAME,
+AWS_REGION and the usual AWS credentials). Run with `--dry-run` first to
+see what would be moved.
+"""
+
+import argparse
+import os
+import sys
+from typing import Iterator, Optional, Tuple
+
+import boto3
+
+from app import GALLERY_PREFIX, THUMBNAIL_PREFIX
+
+
+def legacy_moves(s3_client: object, bucket: str) -> Iterator[Tuple[str, str]]:
+    """Yield (old_key, new_key) for every object outside the current layout."""
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for resp in paginator.paginate(Bucket=bucket):
+        for obj in resp.get("Contents", []):
+            new_key = migrated_key(obj["Key"])
+            if new_key is not None:
+                yield obj["Key"], new_key
+
+
+def migrated_key(key: str) -> Optional[str]:
+    """Return the current-layout key for a legacy key, or None if already migrated."""
+    if key.startswith(GALLERY_PREFIX) or key.startswith(f"{THUMBNAIL_PREFIX}{GALLERY_PREFIX}"):
+        return None
+    if key.startswith(THUMBNAIL_PREFIX):
+        return f"{THUMBNAIL_PREFIX}{GALLERY_PREFIX}{key[len(THUMBNAIL_PREFIX):]}"
+    return f"{GALLERY_PREFIX}{key}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="only print the planned moves")
+    parser.add_argument(
+        "--keep-originals",
+        action="store_true",
+        help="copy objects to their new keys without deleting the old ones",
+    )
+    args = parser.parse_args()
+
+    bucket = os.environ.get("S3_BUCKET_NAME")
+    if not bucket:
+        print("S3_BUCKET_NAME is not set", file=sys.stderr)
+        return 1
+    s3_client = boto3.client("s3", region_name=os.environ.get("AWS_REGION", "us-east-1"))
+
+    moved = 0
+    for old_key, new_key in legacy_moves(s3_client, bucket):
+        print(f"{old_key} -> {new_key}")
+        if args.dry_run:
+            continue
+        # Managed copy handles objects above the 5 GB CopyObject limit
+        s3_client.copy({"Bucket": bucket, "Key": old_key}, bucket, new_key)
+        if not args.keep_originals:
+            s3_client.delete_object(Bucket=bucket, Key=old_key)
+        moved += 1
+
+    if not args.dry_run:
+        print(f"Moved {moved} object(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
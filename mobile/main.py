@@ -19,7 +19,9 @@ features and polish should be added as you iterate on the design.
 
 import os
 import json
-from typing import List, Dict, Any
+import time
+from typing import Callable, List, Dict, Any, Optional, Tuple
+from urllib.parse import urlencode
 
 from kivy.app import App
 from kivy.uix.screenmanager import ScreenManager, Screen, SlideTransition
@@ -27,13 +29,74 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.image import AsyncImage
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.modalview import ModalView
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.gridlayout import GridLayout
 from kivy.network.urlrequest import UrlRequest
+from kivy.loader import Loader
+from kivy.clock import Clock
 
 
 API_BASE_URL = os.environ.get("API_BASE_URL", "http://localhost:5000/api")
 
+# Download gallery images on several loader threads at once and upload a few
+# textures per frame so the UI stays responsive while they arrive
+Loader.num_workers = 8
+Loader.max_upload_per_frame = 4
+
+# Number of gallery widgets created per frame when populating the grid
+GALLERY_WIDGETS_PER_FRAME = 6
+
+# Fetch the next gallery page once the grid is scrolled this close to the bottom
+# (ScrollView.scroll_y runs from 1 at the top to 0 at the bottom)
+GALLERY_LOAD_MORE_AT = 0.1
+
+# Seconds a GET response is reused without asking the backend again
+CLIENT_CACHE_TTL = 60
+
+# url -> (fetched_at, etag, result) for GET responses from the backend
+_client_cache: Dict[str, Tuple[float, Optional[str], Any]] = {}
+
+
+def fetch_json(
+    url: str,
+    on_result: Callable[[Any], None],
+    on_error: Callable[[UrlRequest, Any], None],
+) -> None:
+    """GET a backend URL, reusing the cached result while it is fresh.
+
+    Once the entry is older than CLIENT_CACHE_TTL the request is sent with
+    If-None-Match, so an unchanged resource costs an empty 304 response.
+    """
+    cached = _client_cache.get(url)
+    if cached is not None and time.time() - cached[0] < CLIENT_CACHE_TTL:
+        on_result(cached[2])
+        return
+
+    headers = {}
+    if cached is not None and cached[1]:
+        headers["If-None-Match"] = cached[1]
+
+    def on_success(req: UrlRequest, result: Any) -> None:
+        resp_headers = req.resp_headers or {}
+        etag = next((v for k, v in resp_headers.items() if k.lower() == "etag"), None)
+        _client_cache[url] = (time.time(), etag, result)
+        on_result(result)
+
+    def on_redirect(req: UrlRequest, result: Any) -> None:
+        if req.resp_status == 304 and cached is not None:
+            _client_cache[url] = (time.time(), cached[1], cached[2])
+            on_result(cached[2])
+
+    UrlRequest(
+        url,
+        on_success=on_success,
+        on_redirect=on_redirect,
+        on_error=on_error,
+        req_headers=headers,
+    )
+
 
 class HomeScreen(Screen):
     """Main menu screen providing navigation to other sections."""
@@ -61,6 +124,26 @@ class HomeScreen(Screen):
         self.manager.current = screen_name
 
 
+class GalleryImage(ButtonBehavior, AsyncImage):
+    """Gallery thumbnail that opens the full-size image when tapped."""
+
+    def __init__(self, thumb_url: Optional[str], full_url: str, **kwargs: Any) -> None:
+        super().__init__(source=thumb_url or full_url, **kwargs)
+        self.full_url = full_url
+
+    def on_error(self, error: Any) -> None:
+        # Older uploads have no thumbnail; fall back to the original image
+        if self.source != self.full_url:
+            self.source = self.full_url
+
+    def on_release(self) -> None:
+        view = ModalView(size_hint=(0.95, 0.95))
+        full = AsyncImage(source=self.full_url)
+        full.bind(on_touch_down=lambda instance, touch: view.dismiss())
+        view.add_widget(full)
+        view.open()
+
+
 class GalleryScreen(Screen):
     """Display images fetched from the backend's gallery endpoint."""
 
@@ -76,11 +159,21 @@ class GalleryScreen(Screen):
 
         # Scrollable grid of images
         self.scroll = ScrollView(size_hint=(1, 0.9))
+        self.scroll.bind(scroll_y=lambda instance, value: self.maybe_load_more())
         self.grid = GridLayout(cols=2, spacing=10, size_hint_y=None)
         self.grid.bind(minimum_height=self.grid.setter('height'))
+        self.grid.bind(height=lambda instance, value: self.maybe_load_more())
         self.scroll.add_widget(self.grid)
         self.layout.add_widget(self.scroll)
         self.add_widget(self.layout)
+        # Incremented on every reload so responses from an earlier load are dropped
+        self._load_id = 0
+        # Gallery items waiting to be turned into widgets, drained once per frame
+        self._pending: List[Dict[str, Any]] = []
+        self._add_trigger = Clock.create_trigger(self.add_pending_images)
+        # Token for the next gallery page, and whether a page request is in flight
+        self._next_token: Optional[str] = None
+        self._loading = False
 
     def on_pre_enter(self) -> None:
         """Called before the screen is displayed. Trigger loading of images."""
@@ -90,23 +183,65 @@ class GalleryScreen(Screen):
         self.manager.transition = SlideTransition(direction="right")
         self.manager.current = "home"
 
-    def load_images(self) -> None:
-        """Fetch gallery images from the backend and populate the grid."""
-        self.grid.clear_widgets()
-
-        def on_success(req: UrlRequest, result: Any) -> None:
-            if not isinstance(result, list):
+    def load_images(self, page_token: Optional[str] = None) -> None:
+        """Fetch gallery images from the backend and populate the grid.
+
+        The backend returns the gallery one page at a time; the page after
+        `next_token` is only requested once the user scrolls near the bottom.
+        """
+        if page_token is None:
+            self._load_id += 1
+            self._pending = []
+            self._next_token = None
+            self.grid.clear_widgets()
+        load_id = self._load_id
+        self._loading = True
+
+        def on_result(result: Any) -> None:
+            if load_id != self._load_id:
+                return
+            self._loading = False
+            if not isinstance(result, dict):
                 return
-            for item in result:
-                url = item.get("url")
-                if url:
-                    img = AsyncImage(source=url, size_hint=(1, None), height=200)
-                    self.grid.add_widget(img)
+            self._next_token = result.get("next_token")
+            self.queue_images(result.get("items", []))
 
         def on_error(req: UrlRequest, error: Any) -> None:
+            if load_id == self._load_id:
+                self._loading = False
             print(f"Failed to load images: {error}")
 
-        UrlRequest(f"{API_BASE_URL}/gallery", on_success=on_success, on_error=on_error)
+        url = f"{API_BASE_URL}/gallery"
+        if page_token:
+            url = f"{url}?{urlencode({'page_token': page_token})}"
+        fetch_json(url, on_result, on_error)
+
+    def queue_images(self, items: List[Dict[str, Any]]) -> None:
+        """Queue gallery items to be added over the next frames."""
+        self._pending.extend(items)
+        self._add_trigger()
+
+    def add_pending_images(self, dt: float) -> None:
+        """Add image widgets a few per frame to avoid stalling the main thread."""
+        batch = self._pending[:GALLERY_WIDGETS_PER_FRAME]
+        del self._pending[:GALLERY_WIDGETS_PER_FRAME]
+        for item in batch:
+            url = item.get("url")
+            if url:
+                img = GalleryImage(item.get("thumb"), url, size_hint=(1, None), height=200)
+                self.grid.add_widget(img)
+        if self._pending:
+            self._add_trigger()
+        else:
+            self.maybe_load_more()
+
+    def maybe_load_more(self) -> None:
+        """Request the next page when the grid is scrolled (or fits) to the bottom."""
+        if not self._next_token or self._loading or self._pending:
+            return
+        fits = self.grid.height <= self.scroll.height
+        if fits or self.scroll.scroll_y <= GALLERY_LOAD_MORE_AT:
+            self.load_images(page_token=self._next_token)
 
 
 class CalendarScreen(Screen):
@@ -137,7 +272,7 @@ class CalendarScreen(Screen):
     def load_events(self) -> None:
         self.events_box.clear_widgets()
 
-        def on_success(req: UrlRequest, result: Any) -> None:
+        def on_result(result: Any) -> None:
             if not isinstance(result, list):
                 return
             for event in result:
@@ -152,7 +287,7 @@ class CalendarScreen(Screen):
         def on_error(req: UrlRequest, error: Any) -> None:
             print(f"Failed to load events: {error}")
 
-        UrlRequest(f"{API_BASE_URL}/calendar", on_success=on_success, on_error=on_error)
+        fetch_json(f"{API_BASE_URL}/calendar", on_result, on_error)
 
 
 class PaymentsScreen(Screen):